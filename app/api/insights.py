@@ -8,17 +8,23 @@ Separated from the webhook router for cleaner concern boundaries.
 import asyncio
 import json
 import logging
+from collections import OrderedDict, defaultdict
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi import APIRouter, HTTPException, Query, Response, WebSocket, WebSocketDisconnect, status
 
-from app.models.insights import InsightType, SessionInsights
+from app.models.insights import TYPE_VALUES, InsightType, SessionInsights
 from app.store.session_store import session_store
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/insights", tags=["Insights"])
 
+# Serialized WebSocket payloads shared by all viewers of a session:
+# session_id -> (insights object it was built from, JSON text)
+_WS_PAYLOAD_CACHE_SIZE = 512
+_ws_payload_cache: OrderedDict[str, tuple[SessionInsights, str]] = OrderedDict()
+
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
@@ -33,6 +39,27 @@ async def _get_session_or_404(session_id: str):
     return session
 
 
+def _ws_payload(session_id: str, insights: SessionInsights) -> str:
+    """
+    Return the JSON push payload for a session's current insights.
+
+    Each ``SessionInsights`` object is serialized once, no matter how many
+    clients are watching the session. A new analysis result replaces the
+    session's entry; least recently used sessions are evicted past the cap.
+    """
+    cached = _ws_payload_cache.get(session_id)
+    if cached is not None and cached[0] is insights:
+        _ws_payload_cache.move_to_end(session_id)
+        return cached[1]
+
+    payload = insights.model_dump_json()
+    _ws_payload_cache[session_id] = (insights, payload)
+    _ws_payload_cache.move_to_end(session_id)
+    if len(_ws_payload_cache) > _WS_PAYLOAD_CACHE_SIZE:
+        _ws_payload_cache.popitem(last=False)
+    return payload
+
+
 # ── REST Endpoints ─────────────────────────────────────────────────────
 
 @router.get(
@@ -53,12 +80,15 @@ async def get_insights(
         le=1.0,
         description="Minimum confidence threshold (0.0–1.0).",
     ),
-) -> SessionInsights:
+) -> Response:
     """
     Retrieve insights with optional filtering.
 
     - ``type``: return only insights of this category
     - ``min_confidence``: exclude insights below this confidence score
+
+    The response is serialized straight to JSON bytes by Pydantic, skipping
+    FastAPI's response-model re-validation of an already-typed model.
     """
     await _get_session_or_404(session_id)
 
@@ -67,23 +97,25 @@ async def get_insights(
     if insights is None:
         insights = await session_store.run_analysis(session_id)
 
-    # Apply filters
-    filtered = insights.insights
-    if type is not None:
-        filtered = [i for i in filtered if i.type == type]
-    if min_confidence > 0.0:
-        filtered = [i for i in filtered if i.confidence >= min_confidence]
-
-    # Rebuild summary for filtered set
-    from collections import Counter
-    type_counts = Counter(i.type.value for i in filtered)
+    # Apply filters and rebuild the summary for the filtered set in one pass
+    filtered = []
+    summary: dict[str, int] = {}
+    for i in insights.insights:
+        if type is not None and i.type != type:
+            continue
+        if i.confidence < min_confidence:
+            continue
+        filtered.append(i)
+        category = TYPE_VALUES[i.type]
+        summary[category] = summary.get(category, 0) + 1
 
-    return SessionInsights(
+    result = SessionInsights(
         session_id=session_id,
         insights=filtered,
         total_insights=len(filtered),
-        summary=dict(type_counts),
+        summary=summary,
     )
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -103,23 +135,22 @@ async def get_coaching(session_id: str) -> dict[str, Any]:
         insights = await session_store.run_analysis(session_id)
 
     # Group suggestions by type, keep only high-confidence ones
-    coaching: dict[str, list[dict[str, Any]]] = {}
+    coaching: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    total = 0
     for i in insights.insights:
         if i.confidence < 0.6:
             continue
-        category = i.type.value
-        if category not in coaching:
-            coaching[category] = []
-        coaching[category].append({
+        coaching[TYPE_VALUES[i.type]].append({
             "suggestion": i.suggestion,
             "trigger": i.matched_phrase,
             "confidence": i.confidence,
         })
+        total += 1
 
     return {
         "session_id": session_id,
-        "coaching": coaching,
-        "total_suggestions": sum(len(v) for v in coaching.values()),
+        "coaching": dict(coaching),
+        "total_suggestions": total,
     }
 
 
@@ -130,8 +161,9 @@ async def insights_websocket(websocket: WebSocket, session_id: str):
     """
     WebSocket endpoint for real-time insight streaming.
 
-    On connect, sends the latest cached insights. Then polls for
-    new insights every 2 seconds and pushes updates if the count changes.
+    On connect, sends the latest cached insights. Then sleeps until the
+    session store signals that the session's insights changed (or the
+    client sends a message) and pushes updates if the count changes.
 
     The client can send ``{"action": "refresh"}`` to force a re-analysis.
     """
@@ -139,20 +171,14 @@ async def insights_websocket(websocket: WebSocket, session_id: str):
     logger.info("WebSocket connected | session=%s", session_id)
 
     last_count = 0
+    receive_task: asyncio.Task[str] | None = None
+    update_task: asyncio.Task[bool] | None = None
+    session_store.watch(session_id)
 
     try:
         while True:
-            # Check for client messages (non-blocking)
-            try:
-                data = await asyncio.wait_for(
-                    websocket.receive_text(), timeout=2.0
-                )
-                msg = json.loads(data)
-                if msg.get("action") == "refresh":
-                    await session_store.run_analysis(session_id)
-                    logger.info("WebSocket refresh requested | session=%s", session_id)
-            except asyncio.TimeoutError:
-                pass  # No client message — continue polling
+            # Take the event *before* reading insights so no update is missed
+            update_event = session_store.update_event(session_id)
 
             # Get current insights
             insights = await session_store.get_insights(session_id)
@@ -161,10 +187,33 @@ async def insights_websocket(websocket: WebSocket, session_id: str):
 
             if insights and insights.total_insights != last_count:
                 last_count = insights.total_insights
-                await websocket.send_json(insights.model_dump())
+                await websocket.send_text(_ws_payload(session_id, insights))
+
+            # Wait for a client message or an insights update
+            if receive_task is None:
+                receive_task = asyncio.create_task(websocket.receive_text())
+            update_task = asyncio.create_task(update_event.wait())
+            done, _ = await asyncio.wait(
+                {receive_task, update_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            update_task.cancel()
+
+            if receive_task in done:
+                data = receive_task.result()
+                receive_task = None
+                msg = json.loads(data)
+                if msg.get("action") == "refresh":
+                    await session_store.run_analysis(session_id)
+                    logger.info("WebSocket refresh requested | session=%s", session_id)
 
     except WebSocketDisconnect:
         logger.info("WebSocket disconnected | session=%s", session_id)
     except Exception:
         logger.exception("WebSocket error | session=%s", session_id)
         await websocket.close(code=1011)
+    finally:
+        for task in (receive_task, update_task):
+            if task is not None:
+                task.cancel()
+        session_store.unwatch(session_id)
@@ -2,8 +2,9 @@
 Omi webhook receiver and session management endpoints.
 
 Accepts POST requests from Omi containing live transcription segments,
-validates the payload, stores segments in the session store, and returns
-a fast 200 OK response.
+validates the payload, queues the segments for storage, and returns a
+fast 200 OK response. A single background worker drains the queue into
+the session store.
 
 Also exposes session analytics: summaries, speaker stats, and formatted transcripts.
 """
@@ -12,19 +13,41 @@ import asyncio
 import logging
 from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Request, status
+from cachetools import TTLCache
+from fastapi import APIRouter, Header, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
 
 from app.models.insights import SessionInsights
 from app.models.session import FormattedTranscript, SessionSummary
-from app.models.webhook import OmiWebhookPayload, WebhookResponse
+from app.models.webhook import OmiWebhookPayload, TranscriptSegment, WebhookResponse
 from app.store.session_store import session_store
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/omi", tags=["Omi Webhook"])
 
-# Simple in-memory idempotency cache: key -> response
-_idempotency_cache: dict[str, WebhookResponse] = {}
+# Bounded in-memory idempotency cache: key -> serialized response body.
+# Keys expire after the replay window so the cache can't grow unbounded.
+_IDEMPOTENCY_MAX_KEYS = 10_000
+_IDEMPOTENCY_TTL_SECONDS = 600
+_idempotency_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=_IDEMPOTENCY_MAX_KEYS, ttl=_IDEMPOTENCY_TTL_SECONDS
+)
+
+# Bursts of webhooks for one session within this window share one analysis
+_ANALYSIS_DEBOUNCE_SECONDS = 0.5
+# session_id -> pending (trailing) background analysis task
+_pending_analysis: dict[str, asyncio.Task[None]] = {}
+
+# Webhook payloads waiting to be stored. Created by start_ingest_worker()
+# on the serving event loop; when it is None segments are stored inline.
+_INGEST_QUEUE_SIZE = 10_000
+# On shutdown, wait this long for already-acknowledged payloads to be stored
+_INGEST_DRAIN_TIMEOUT_SECONDS = 5.0
+_ingest_queue: asyncio.Queue[tuple[str, list[TranscriptSegment]]] | None = None
+_ingest_task: asyncio.Task[None] | None = None
 
 
 # ── Helpers ────────────────────────────────────────────────────────────
@@ -40,6 +63,42 @@ async def _get_session_or_404(session_id: str):
     return session
 
 
+def _inline_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """JSON schema for ``model`` with its ``$defs`` references inlined."""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+async def _parse_payload(request: Request) -> OmiWebhookPayload:
+    """
+    Validate the raw request body straight from JSON.
+
+    ``model_validate_json`` parses and validates in one pass, skipping the
+    intermediate dict FastAPI would build. Errors are reported in FastAPI's
+    usual 422 shape.
+    """
+    body = await request.body()
+    try:
+        return OmiWebhookPayload.model_validate_json(body)
+    except ValidationError as exc:
+        errors = [
+            {**error, "loc": ("body", *error["loc"])}
+            for error in exc.errors(include_url=False)
+        ]
+        raise RequestValidationError(errors, body=body) from None
+
+
 # ── Webhook ────────────────────────────────────────────────────────────
 
 @router.post(
@@ -51,61 +110,158 @@ async def _get_session_or_404(session_id: str):
         "Accepts real-time transcription segments from Omi and stores them by session. "
         "Supports optional X-Idempotency-Key header for safe retries."
     ),
+    # The body is parsed by hand (see _parse_payload); document it here
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema(OmiWebhookPayload)}},
+        }
+    },
 )
 async def receive_webhook(
-    payload: OmiWebhookPayload,
+    request: Request,
     x_idempotency_key: str | None = Header(default=None),
-) -> WebhookResponse:
+) -> WebhookResponse | Response:
     """
     Handle an incoming Omi webhook event.
 
     1. Check idempotency key (if provided) — return cached response on duplicate
-    2. Validate the payload (handled automatically by Pydantic)
-    3. Store segments in the session store (with deduplication)
-    4. Trigger background insight analysis
-    5. Return 200 OK immediately
+    2. Validate the payload (replays skip this entirely)
+    3. Queue the segments for the ingest worker (503 if the queue is full)
+    4. Return 200 OK immediately
+
+    The worker stores the segments (with deduplication) and triggers a
+    debounced background insight analysis. Since storage happens after the
+    response, ``segments_received`` counts the segments accepted, not the
+    number that turned out to be new.
     """
-    # Idempotency: return cached response if key was already processed
-    if x_idempotency_key and x_idempotency_key in _idempotency_cache:
-        logger.info(
-            "Idempotent replay | key=%s | session=%s",
-            x_idempotency_key,
-            payload.session_id,
-        )
-        return _idempotency_cache[x_idempotency_key]
-
-    new_count = await session_store.add_segments(
-        session_id=payload.session_id,
-        segments=payload.segments,
-    )
+    # Idempotency: replay the cached body if key was already processed
+    cached_body = _idempotency_cache.get(x_idempotency_key) if x_idempotency_key else None
+    if cached_body is not None:
+        logger.info("Idempotent replay | key=%s", x_idempotency_key)
+        return Response(content=cached_body, media_type="application/json")
+
+    payload = await _parse_payload(request)
+
+    if _ingest_queue is None:
+        # No ingest worker running — store inline
+        await _store_segments(payload.session_id, payload.segments)
+    else:
+        try:
+            _ingest_queue.put_nowait((payload.session_id, payload.segments))
+        except asyncio.QueueFull:
+            logger.warning("Ingest queue full | session=%s", payload.session_id)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Ingest queue is full. Please retry shortly.",
+            )
 
     logger.info(
-        "Webhook received | session=%s | segments_in_payload=%d | new_stored=%d",
+        "Webhook received | session=%s | segments_in_payload=%d",
         payload.session_id,
         len(payload.segments),
-        new_count,
     )
 
     response = WebhookResponse(
         status="ok",
         session_id=payload.session_id,
-        segments_received=new_count,
+        segments_received=len(payload.segments),
     )
 
     # Cache the response for idempotency
     if x_idempotency_key:
-        _idempotency_cache[x_idempotency_key] = response
-
-    # Trigger insight analysis in the background (non-blocking)
-    asyncio.create_task(_run_background_analysis(payload.session_id))
+        _idempotency_cache[x_idempotency_key] = response.model_dump_json().encode()
 
     return response
 
 
+# ── Ingest worker ─────────────────────────────────────────────────────
+
+async def _store_segments(session_id: str, segments: list[TranscriptSegment]) -> None:
+    """Store segments and trigger background analysis if any were new."""
+    new_count = await session_store.add_segments(
+        session_id=session_id,
+        segments=segments,
+    )
+    logger.info(
+        "Segments stored | session=%s | new_stored=%d",
+        session_id,
+        new_count,
+    )
+    if new_count:
+        # Trigger insight analysis in the background (non-blocking)
+        _schedule_analysis(session_id)
+
+
+async def _ingest_worker(queue: asyncio.Queue[tuple[str, list[TranscriptSegment]]]) -> None:
+    """Drain queued webhook payloads into the session store, in arrival order."""
+    while True:
+        session_id, segments = await queue.get()
+        try:
+            await _store_segments(session_id, segments)
+        except Exception:
+            logger.exception("Storing segments failed | session=%s", session_id)
+        finally:
+            queue.task_done()
+
+
+def start_ingest_worker() -> None:
+    """Create the ingest queue and start its worker on the running loop."""
+    global _ingest_queue, _ingest_task
+    _ingest_queue = asyncio.Queue(maxsize=_INGEST_QUEUE_SIZE)
+    _ingest_task = asyncio.create_task(_ingest_worker(_ingest_queue))
+
+
+async def stop_ingest_worker() -> None:
+    """
+    Drain the ingest queue, then stop the worker; later webhooks are
+    stored inline.
+
+    Queued payloads were already acknowledged with 200, so they are given
+    up to ``_INGEST_DRAIN_TIMEOUT_SECONDS`` to be stored before the worker
+    is cancelled. Anything still queued after that is logged as dropped.
+    """
+    global _ingest_queue, _ingest_task
+    queue, task = _ingest_queue, _ingest_task
+    _ingest_queue, _ingest_task = None, None
+    if task is not None:
+        try:
+            await asyncio.wait_for(queue.join(), timeout=_INGEST_DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Ingest queue not drained on shutdown | dropped_payloads=%d",
+                queue.qsize(),
+            )
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+# ── Background analysis ───────────────────────────────────────────────
+
+def _schedule_analysis(session_id: str) -> None:
+    """Schedule a background analysis unless one is already pending."""
+    if session_id not in _pending_analysis:
+        _pending_analysis[session_id] = asyncio.create_task(
+            _run_background_analysis(session_id)
+        )
+
+
 async def _run_background_analysis(session_id: str) -> None:
-    """Run insight analysis without blocking the webhook response."""
+    """
+    Run incremental insight analysis without blocking the webhook response.
+
+    Waits out the debounce window first so that every segment stored in
+    the meantime is picked up by this single run.
+    """
+    await asyncio.sleep(_ANALYSIS_DEBOUNCE_SECONDS)
+    # Webhooks arriving from here on schedule a fresh run
+    _pending_analysis.pop(session_id, None)
+
     try:
-        result = await session_store.run_analysis(session_id)
+        result = await session_store.analyze_incremental(session_id)
         if result:
             logger.info(
                 "Background analysis done | session=%s | insights=%d",
@@ -116,6 +272,8 @@ async def _run_background_analysis(session_id: str) -> None:
         logger.exception("Background analysis failed | session=%s", session_id)
 
 
+# ── Sessions ──────────────────────────────────────────────────────────
+
 @router.get(
     "/sessions",
     summary="List active sessions",
@@ -138,10 +296,10 @@ async def list_sessions() -> dict[str, Any]:
     summary="Get session transcript",
     description="Returns all stored transcript segments for a given session.",
 )
-async def get_session(session_id: str) -> dict[str, Any]:
+async def get_session(session_id: str) -> ORJSONResponse:
     """Retrieve raw transcript data for a specific session."""
     session = await _get_session_or_404(session_id)
-    return session.to_dict()
+    return ORJSONResponse(session.to_dict())
 
 
 @router.get(
@@ -150,10 +308,11 @@ async def get_session(session_id: str) -> dict[str, Any]:
     summary="Get session summary",
     description="Returns talk ratio, speaker stats, word counts, and duration.",
 )
-async def get_session_summary(session_id: str) -> SessionSummary:
+async def get_session_summary(session_id: str) -> Response:
     """Retrieve aggregated analytics for a session."""
     session = await _get_session_or_404(session_id)
-    return session.get_summary()
+    summary = session.get_summary()
+    return Response(content=summary.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -162,10 +321,17 @@ async def get_session_summary(session_id: str) -> SessionSummary:
     summary="Get formatted transcript",
     description="Returns the full transcript with speaker labels, ordered by timestamp.",
 )
-async def get_session_transcript(session_id: str) -> FormattedTranscript:
+async def get_session_transcript(session_id: str) -> ORJSONResponse:
     """Retrieve the formatted, speaker-labeled transcript."""
     session = await _get_session_or_404(session_id)
-    return session.get_formatted_transcript()
+    transcript = session.get_formatted_transcript()
+    # Every field is already JSON-native (lines are plain dicts), so orjson
+    # encodes them directly without a model_dump pass first
+    return ORJSONResponse({
+        "session_id": transcript.session_id,
+        "lines": transcript.lines,
+        "plain_text": transcript.plain_text,
+    })
 
 
 # ── Insights ──────────────────────────────────────────────────────────
@@ -176,7 +342,7 @@ async def get_session_transcript(session_id: str) -> FormattedTranscript:
     summary="Get sales insights",
     description="Returns detected sales insights (objections, signals, competitors, next-steps).",
 )
-async def get_session_insights(session_id: str) -> SessionInsights:
+async def get_session_insights(session_id: str) -> Response:
     """Retrieve sales insights for a session. Runs analysis if not yet cached."""
     await _get_session_or_404(session_id)  # ensure session exists
 
@@ -184,5 +350,5 @@ async def get_session_insights(session_id: str) -> SessionInsights:
     insights = await session_store.get_insights(session_id)
     if insights is None:
         insights = await session_store.run_analysis(session_id)
-    return insights
+    return Response(content=insights.model_dump_json(), media_type="application/json")
 
@@ -24,6 +24,9 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
 
+    # --- Session store ---
+    max_sessions: int = 10_000  # least recently used sessions are evicted
+
     # --- Redis (Phase 2+) ---
     redis_url: str = "redis://localhost:6379/0"
 
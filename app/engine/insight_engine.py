@@ -7,18 +7,26 @@ commitments, and stall tactics.
 
 Design:
 - Each rule category has a list of (phrase, confidence, suggestion) tuples.
-- The engine lowercases text and checks for substring matches.
+- The engine lowercases text and matches every rule phrase in a single
+  Aho-Corasick pass per segment (plain substring checks if the
+  ``pyahocorasick`` extension is unavailable).
 - A sliding window can be applied to analyze only recent segments.
 - Results are deduplicated by (type, matched_phrase, timestamp) to avoid
   repeated insights from the same segment.
+- Previous results can be passed back in, so a live session only needs
+  its newly arrived segments scanned.
 """
 
 import logging
-from collections import Counter
 from dataclasses import dataclass, field
 
-from app.models.insights import Insight, InsightType, SessionInsights
-from app.models.webhook import TranscriptSegment
+from app.models.insights import TYPE_VALUES, Insight, InsightType, SessionInsights
+from app.models.webhook import TranscriptRecord
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - C extension not installed
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +119,56 @@ _RULE_MAP: dict[InsightType, list[Rule]] = {
     InsightType.STALL_TACTIC: STALL_TACTIC_RULES,
 }
 
+# Flat (type, phrase, confidence, suggestion) view of every rule, in
+# _RULE_MAP order. Matchers report indices into it, and the hot loop unpacks
+# plain tuples instead of paying for dataclass attribute lookups.
+_FLAT_RULES: tuple[tuple[InsightType, str, float, str], ...] = tuple(
+    (insight_type, rule.phrase, rule.confidence, rule.suggestion)
+    for insight_type, rules in _RULE_MAP.items()
+    for rule in rules
+)
+
+# One bit per distinct (type, phrase) dedup key, and each flat rule's bit.
+# Per timestamp, the engine keeps an int bitmask of the keys already emitted.
+_KEY_BITS: dict[tuple[InsightType, str], int] = {
+    key: 1 << bit
+    for bit, key in enumerate(dict.fromkeys(
+        (insight_type, phrase) for insight_type, phrase, _, _ in _FLAT_RULES
+    ))
+}
+_RULE_BITS: tuple[int, ...] = tuple(
+    _KEY_BITS[(insight_type, phrase)] for insight_type, phrase, _, _ in _FLAT_RULES
+)
+
+
+def _build_automaton():
+    """Compile all rule phrases into one Aho-Corasick automaton (or None)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, (_, phrase, _, _) in enumerate(_FLAT_RULES):
+        # A phrase may appear in several categories — keep every rule index
+        automaton.add_word(phrase, automaton.get(phrase, ()) + (idx,))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+
+def _match_rules(text_lower: str) -> list[int]:
+    """Return indices into ``_FLAT_RULES`` whose phrase occurs in the text, in rule order."""
+    if _AUTOMATON is None:
+        return [
+            idx for idx, (_, phrase, _, _) in enumerate(_FLAT_RULES)
+            if phrase in text_lower
+        ]
+
+    matched: set[int] = set()
+    for _, indices in _AUTOMATON.iter(text_lower):
+        matched.update(indices)
+    return sorted(matched)
+
 
 # ── Engine ─────────────────────────────────────────────────────────────
 
@@ -132,8 +190,9 @@ class InsightEngine:
 
     def analyze_segments(
         self,
-        segments: list[TranscriptSegment],
+        segments: list[TranscriptRecord],
         session_id: str = "",
+        previous: SessionInsights | None = None,
     ) -> SessionInsights:
         """
         Scan segments for sales insights.
@@ -141,47 +200,65 @@ class InsightEngine:
         Args:
             segments: Transcript segments to analyze (should be time-ordered).
             session_id: Session identifier for the response.
+            previous: Insights already found for earlier segments of the
+                      session. New matches are merged into them (skipping
+                      duplicates), so only new segments need to be passed.
+                      The sliding window is not applied when merging.
 
         Returns:
             SessionInsights with all detected insights and summary counts.
         """
         # Apply sliding window if configured
         target_segments = segments
-        if self.window_size > 0 and len(segments) > self.window_size:
+        if (
+            previous is None
+            and self.window_size > 0
+            and len(segments) > self.window_size
+        ):
             target_segments = segments[-self.window_size:]
 
         insights: list[Insight] = []
-        seen: set[tuple[str, str, float | None]] = set()  # dedup key
+        summary: dict[str, int] = {}  # counts by type, built while scanning
+        # Dedup by (type, phrase, timestamp): timestamp -> bitmask of _KEY_BITS
+        seen: dict[float | None, int] = {}
+
+        if previous is not None:
+            insights.extend(previous.insights)
+            summary.update(previous.summary)
+            for i in previous.insights:
+                bit = _KEY_BITS.get((i.type, i.matched_phrase), 0)
+                seen[i.timestamp] = seen.get(i.timestamp, 0) | bit
 
         for segment in target_segments:
-            text_lower = segment.text.lower()
-
-            for insight_type, rules in _RULE_MAP.items():
-                for rule in rules:
-                    if rule.phrase in text_lower:
-                        # Dedup by (type, phrase, timestamp)
-                        dedup_key = (insight_type.value, rule.phrase, segment.timestamp)
-                        if dedup_key in seen:
-                            continue
-                        seen.add(dedup_key)
-
-                        insight = Insight(
-                            type=insight_type,
-                            confidence=rule.confidence,
-                            matched_text=segment.text,
-                            matched_phrase=rule.phrase,
-                            speaker=segment.speaker,
-                            timestamp=segment.timestamp,
-                            suggestion=rule.suggestion,
-                        )
-                        insights.append(insight)
+            text = segment.text
+            speaker = segment.speaker
+            timestamp = segment.timestamp
+
+            for idx in _match_rules(segment.text_lower):
+                insight_type, phrase, confidence, suggestion = _FLAT_RULES[idx]
+
+                bit = _RULE_BITS[idx]
+                mask = seen.get(timestamp, 0)
+                if mask & bit:
+                    continue
+                seen[timestamp] = mask | bit
+
+                insight = Insight(
+                    type=insight_type,
+                    confidence=confidence,
+                    matched_text=text,
+                    matched_phrase=phrase,
+                    speaker=speaker,
+                    timestamp=timestamp,
+                    suggestion=suggestion,
+                )
+                insights.append(insight)
+                category = TYPE_VALUES[insight_type]
+                summary[category] = summary.get(category, 0) + 1
 
         # Sort by timestamp, then by confidence descending
         insights.sort(key=lambda i: (i.timestamp or 0, -i.confidence))
 
-        # Build summary counts
-        type_counts = Counter(i.type.value for i in insights)
-
         logger.info(
             "Insight analysis complete | session=%s | segments_scanned=%d | insights_found=%d",
             session_id,
@@ -193,7 +270,7 @@ class InsightEngine:
             session_id=session_id,
             insights=insights,
             total_insights=len(insights),
-            summary=dict(type_counts),
+            summary=summary,
         )
 
 
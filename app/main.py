@@ -11,7 +11,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api import health, insights, webhook
 from app.config import get_settings
@@ -52,7 +52,9 @@ async def lifespan(app: FastAPI):
         settings.app_version,
         settings.environment,
     )
+    webhook.start_ingest_worker()
     yield
+    await webhook.stop_ingest_worker()
     logger.info("👋 %s shutting down", settings.app_name)
 
 
@@ -66,11 +68,12 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="Real-time sales negotiation insights powered by Omi AI transcription.",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # --- Exception Handlers ---
     @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
         """Catch unhandled exceptions and return a clean 500 response."""
         logger.exception(
             "Unhandled error | %s %s | %s",
@@ -78,7 +81,7 @@ def create_app() -> FastAPI:
             request.url.path,
             str(exc),
         )
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "internal_server_error",
@@ -3,36 +3,49 @@ Request logging middleware.
 
 Logs every incoming request with method, path, status code, and latency.
 Uses structured logging for easy parsing by log aggregators.
+
+Implemented as a plain ASGI middleware rather than ``BaseHTTPMiddleware``,
+which wraps every request in an extra task group and memory streams.
 """
 
 import logging
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("negocia.access")
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Log request method, path, status code, and response time."""
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        start = time.perf_counter()
-        response: Response | None = None
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.monotonic_ns()
+        status_code = 500  # reported if the app fails before responding
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
-            elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
-            status_code = response.status_code if response else 500
+            # Integer math only: elapsed time in hundredths of a millisecond
+            elapsed = (time.monotonic_ns() - start) // 10_000
             logger.info(
-                "%s %s → %d (%.2fms)",
-                request.method,
-                request.url.path,
+                "%s %s → %d (%d.%02dms)",
+                scope["method"],
+                scope["path"],
                 status_code,
-                elapsed_ms,
+                elapsed // 100,
+                elapsed % 100,
             )
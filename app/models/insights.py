@@ -6,6 +6,7 @@ an objection, buying signal, competitor mention, or next-step commitment.
 """
 
 from enum import Enum
+from typing import Final
 
 from pydantic import BaseModel, Field
 
@@ -20,6 +21,11 @@ class InsightType(str, Enum):
     STALL_TACTIC = "stall_tactic"
 
 
+# Raw string value of each type. A dict lookup is several times cheaper
+# than ``Enum.value`` (a descriptor call) inside per-insight loops.
+TYPE_VALUES: Final[dict[InsightType, str]] = {t: t.value for t in InsightType}
+
+
 class Insight(BaseModel):
     """A single detected insight from the conversation."""
 
@@ -45,6 +51,8 @@ class Insight(BaseModel):
         description="Recommended response or action for the sales agent.",
     )
 
+    model_config = {"frozen": True}
+
 
 class SessionInsights(BaseModel):
     """All insights detected for a conversation session."""
@@ -56,3 +64,6 @@ class SessionInsights(BaseModel):
         default_factory=dict,
         description="Count of insights by type.",
     )
+
+    # Results are cached and shared between requests — never mutated
+    model_config = {"frozen": True}
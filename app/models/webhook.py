@@ -5,8 +5,14 @@ Designed for resilience:
 - ``speaker`` is optional (Omi may not always provide diarization)
 - ``is_user`` defaults to False when missing
 - Extra fields are ignored (forward-compatible with Omi payload changes)
+
+Accepted segments are stored as lightweight ``TranscriptRecord``
+dataclasses rather than as models.
 """
 
+import sys
+from dataclasses import dataclass, field
+
 from pydantic import BaseModel, Field
 
 
@@ -30,6 +36,36 @@ class TranscriptSegment(BaseModel):
     model_config = {"extra": "ignore"}
 
 
+@dataclass(frozen=True, slots=True)
+class TranscriptRecord:
+    """
+    Stored form of a ``TranscriptSegment``.
+
+    Segments are validated once at the webhook boundary; sessions keep
+    these slotted records instead, a fraction of the size of a model.
+    """
+
+    text: str
+    speaker: str | None
+    is_user: bool
+    timestamp: float
+    # Lowercased text for the insight engine's keyword matching
+    text_lower: str = field(repr=False, compare=False)
+
+    @classmethod
+    def from_segment(cls, segment: TranscriptSegment) -> "TranscriptRecord":
+        """Copy a validated segment into a record."""
+        speaker = segment.speaker
+        return cls(
+            segment.text,
+            # Few distinct speakers per call: share one string per tag
+            sys.intern(speaker) if speaker else speaker,
+            segment.is_user,
+            segment.timestamp,
+            segment.text.lower(),
+        )
+
+
 class OmiWebhookPayload(BaseModel):
     """
     Top-level payload received from Omi via webhook POST.
@@ -4,29 +4,78 @@ In-memory session store for conversation transcripts.
 Holds transcript segments grouped by ``session_id``.
 Uses an ``asyncio.Lock`` to ensure safe concurrent writes
 from multiple webhook requests hitting the same session.
+Insight analysis runs on a worker thread pool so it never
+blocks the event loop.
 """
 
 import asyncio
-from collections import defaultdict
+import os
+import sys
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
 from typing import Any
 
+from app.config import get_settings
 from app.models.insights import SessionInsights
 from app.models.session import FormattedTranscript, SessionSummary, SpeakerStats
-from app.models.webhook import TranscriptSegment
+from app.models.webhook import TranscriptRecord, TranscriptSegment
 
 # Label used when Omi doesn't provide a speaker tag
 _UNKNOWN_SPEAKER = "UNKNOWN"
 
+_by_timestamp = attrgetter("timestamp")
+
+# Insight analysis is CPU-bound — run it off the event loop
+_ANALYSIS_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="insight",
+)
+
+
+async def _run_in_pool(func, /, **kwargs):
+    """Run a blocking call on the analysis thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ANALYSIS_POOL, partial(func, **kwargs))
+
 
 @dataclass
 class SessionData:
     """Container for all data associated with a single conversation session."""
 
     session_id: str
-    segments: list[TranscriptSegment] = field(default_factory=list)
+    # Kept sorted by timestamp (ties in arrival order) by add_segments
+    segments: list[TranscriptRecord] = field(default_factory=list)
     segment_count: int = 0
     latest_insights: SessionInsights | None = None
+    # Normalized speaker label of each segment, aligned with ``segments``
+    _labels: list[str] = field(default_factory=list, repr=False)
+    # (timestamp, text) of every stored segment, for O(1) deduplication
+    _seen_keys: set[tuple[float, str]] = field(default_factory=set, repr=False)
+    # Segments stored since the last analysis run (in arrival order)
+    _unanalyzed: list[TranscriptRecord] = field(default_factory=list, repr=False)
+    # Running per-speaker aggregates, updated as segments are added
+    _speaker_segments: defaultdict[str, int] = field(
+        default_factory=lambda: defaultdict(int), repr=False
+    )
+    _speaker_words: defaultdict[str, int] = field(
+        default_factory=lambda: defaultdict(int), repr=False
+    )
+    _total_words: int = field(default=0, repr=False)
+    # Raw speaker tag -> interned normalized label
+    _label_cache: dict[str | None, str] = field(default_factory=dict, repr=False)
+    # Guards mutation of this session (held briefly; never across the engine)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False, compare=False)
+    # Serializes engine runs on this session; ingest never waits on it
+    _analysis_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, repr=False, compare=False
+    )
+    # Built views, reused until add_segments stores something new
+    _cached_transcript: FormattedTranscript | None = field(default=None, repr=False)
+    _cached_summary: SessionSummary | None = field(default=None, repr=False)
 
     # ── Segment ingestion ──────────────────────────────────────────────
 
@@ -35,25 +84,54 @@ class SessionData:
         Append new transcript segments and return the count added.
 
         Deduplication (by timestamp + text) prevents double-processing
-        if Omi resends the same segments.
+        if Omi resends the same segments. Segments are inserted in
+        timestamp order; in-order batches (the common case) are appended.
         """
-        existing_keys = {
-            (s.timestamp, s.text) for s in self.segments
-        }
-        unique = [
-            s for s in new_segments
-            if (s.timestamp, s.text) not in existing_keys
-        ]
-        self.segments.extend(unique)
+        unique: list[TranscriptRecord] = []
+        seen = self._seen_keys
+        for s in new_segments:
+            key = (s.timestamp, s.text)
+            if key not in seen:
+                seen.add(key)
+                unique.append(TranscriptRecord.from_segment(s))
+
+        # Label and count words once per segment, in arrival order
+        labels: list[str] = []
+        label_cache = self._label_cache
+        for seg in unique:
+            label = label_cache.get(seg.speaker)
+            if label is None:
+                label = label_cache[seg.speaker] = sys.intern(self._speaker_label(seg))
+            words = len(seg.text.split())
+            self._speaker_segments[label] += 1
+            self._speaker_words[label] += words
+            self._total_words += words
+            labels.append(label)
+
+        if unique:
+            ordered = sorted(zip(unique, labels), key=lambda pair: pair[0].timestamp)
+            if not self.segments or ordered[0][0].timestamp >= self.segments[-1].timestamp:
+                for seg, label in ordered:
+                    self.segments.append(seg)
+                    self._labels.append(label)
+            else:
+                for seg, label in ordered:
+                    idx = bisect_right(self.segments, seg.timestamp, key=_by_timestamp)
+                    self.segments.insert(idx, seg)
+                    self._labels.insert(idx, label)
+            self._cached_transcript = None
+            self._cached_summary = None
+        self._unanalyzed.extend(unique)
         self.segment_count += len(unique)
+
         return len(unique)
 
     # ── Ordered segments ───────────────────────────────────────────────
 
     @property
-    def ordered_segments(self) -> list[TranscriptSegment]:
-        """Segments sorted chronologically by timestamp."""
-        return sorted(self.segments, key=lambda s: s.timestamp)
+    def ordered_segments(self) -> list[TranscriptRecord]:
+        """Segments sorted chronologically by timestamp (the live list)."""
+        return self.segments
 
     # ── Transcript helpers ─────────────────────────────────────────────
 
@@ -67,12 +145,11 @@ class SessionData:
         """Elapsed seconds from first to last segment, or None if < 2 segments."""
         if len(self.segments) < 2:
             return None
-        ordered = self.ordered_segments
-        return ordered[-1].timestamp - ordered[0].timestamp
+        return self.segments[-1].timestamp - self.segments[0].timestamp
 
     # ── Speaker analytics ──────────────────────────────────────────────
 
-    def _speaker_label(self, segment: TranscriptSegment) -> str:
+    def _speaker_label(self, segment: TranscriptRecord) -> str:
         """Normalize speaker labels — map None / empty to UNKNOWN."""
         return segment.speaker.strip() if segment.speaker else _UNKNOWN_SPEAKER
 
@@ -81,25 +158,18 @@ class SessionData:
         Compute per-speaker statistics: segment count, word count, talk ratio.
 
         Talk ratio is the percentage of total words spoken by each speaker.
+        Counts are maintained by ``add_segments``, so this is O(#speakers).
         """
-        speaker_segments: dict[str, int] = defaultdict(int)
-        speaker_words: dict[str, int] = defaultdict(int)
-
-        for seg in self.segments:
-            label = self._speaker_label(seg)
-            speaker_segments[label] += 1
-            speaker_words[label] += len(seg.text.split())
-
-        total_words = sum(speaker_words.values()) or 1  # avoid division by zero
+        total_words = self._total_words or 1  # avoid division by zero
 
         return [
             SpeakerStats(
                 speaker=speaker,
-                segment_count=speaker_segments[speaker],
+                segment_count=self._speaker_segments[speaker],
                 word_count=words,
                 talk_ratio=round((words / total_words) * 100, 1),
             )
-            for speaker, words in speaker_words.items()
+            for speaker, words in self._speaker_words.items()
         ]
 
     # ── Formatted transcript ───────────────────────────────────────────
@@ -109,40 +179,47 @@ class SessionData:
         Build a formatted transcript with speaker-labeled lines.
 
         Returns both structured ``lines`` (for frontends) and a
-        ``plain_text`` rendering (for analysis / LLMs).
+        ``plain_text`` rendering (for analysis / LLMs). The result is
+        cached until new segments arrive; callers must not mutate it.
         """
-        lines = []
-        plain_parts = []
+        if self._cached_transcript is not None:
+            return self._cached_transcript
 
-        for seg in self.ordered_segments:
-            label = self._speaker_label(seg)
-            line = {
+        lines = [
+            {
                 "speaker": label,
                 "text": seg.text,
                 "timestamp": seg.timestamp,
                 "is_user": seg.is_user,
             }
-            lines.append(line)
-            plain_parts.append(f"[{label}]: {seg.text}")
+            for seg, label in zip(self.segments, self._labels)
+        ]
+        # join() materializes its input anyway, so hand it a list directly
+        plain_text = "\n".join([
+            f"[{label}]: {seg.text}" for seg, label in zip(self.segments, self._labels)
+        ])
 
-        return FormattedTranscript(
+        self._cached_transcript = FormattedTranscript(
             session_id=self.session_id,
             lines=lines,
-            plain_text="\n".join(plain_parts),
+            plain_text=plain_text,
         )
+        return self._cached_transcript
 
     # ── Summary ────────────────────────────────────────────────────────
 
     def get_summary(self) -> SessionSummary:
-        """Return a high-level session summary with speaker stats."""
-        total_words = sum(len(s.text.split()) for s in self.segments)
-        return SessionSummary(
+        """Return a high-level session summary with speaker stats (cached)."""
+        if self._cached_summary is not None:
+            return self._cached_summary
+        self._cached_summary = SessionSummary(
             session_id=self.session_id,
             total_segments=self.segment_count,
-            total_words=total_words,
+            total_words=self._total_words,
             speakers=self.get_speaker_stats(),
             duration_seconds=self.duration,
         )
+        return self._cached_summary
 
     # ── Serialization ──────────────────────────────────────────────────
 
@@ -151,7 +228,16 @@ class SessionData:
         return {
             "session_id": self.session_id,
             "segment_count": self.segment_count,
-            "segments": [s.model_dump() for s in self.segments],
+            # Same fields as TranscriptSegment, built inline (no per-record call)
+            "segments": [
+                {
+                    "text": s.text,
+                    "speaker": s.speaker,
+                    "is_user": s.is_user,
+                    "timestamp": s.timestamp,
+                }
+                for s in self.segments
+            ],
         }
 
 
@@ -159,75 +245,197 @@ class SessionStore:
     """
     Thread-safe in-memory store for conversation sessions.
 
-    Each session is keyed by its ``session_id``. An asyncio lock
-    protects concurrent access.
+    Each session is keyed by its ``session_id`` and carries its own
+    asyncio lock, so work on different sessions never serializes.
+
+    The store holds at most ``max_sessions`` sessions; adding a new one
+    beyond that evicts the least recently used (by ingest or lookup).
+    ``list_sessions`` still reports IDs in creation order.
+
+    Writers only touch the registry through single dict operations and
+    never await mid-update, so read-only methods skip locking entirely.
+    Their results are a point-in-time view: a concurrent webhook may land
+    just after the read.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_sessions: int = 10_000) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self._max_sessions = max_sessions
+        # In creation order
         self._sessions: dict[str, SessionData] = {}
-        self._lock = asyncio.Lock()
+        # Session IDs, least recently used first
+        self._recency: OrderedDict[str, None] = OrderedDict()
+        # session_id -> event set on the next insights change (see update_event)
+        self._update_events: dict[str, asyncio.Event] = {}
+        # session_id -> number of open listeners holding its update event
+        self._watchers: dict[str, int] = {}
+
+    def _touch(self, session_id: str) -> SessionData | None:
+        """Return the session and mark it most recently used, or None."""
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._recency.move_to_end(session_id)
+        return session
+
+    def _evict_oldest(self) -> None:
+        """Drop the least recently used session."""
+        session_id, _ = self._recency.popitem(last=False)
+        del self._sessions[session_id]
+        self.notify(session_id)  # wake listeners; they will find no session
+
+    def update_event(self, session_id: str) -> asyncio.Event:
+        """
+        Return an event that is set the next time the session's insights change.
+
+        Each event fires once; waiters fetch a fresh one after waking.
+        """
+        event = self._update_events.get(session_id)
+        if event is None:
+            event = self._update_events[session_id] = asyncio.Event()
+        return event
+
+    def watch(self, session_id: str) -> None:
+        """Register a listener for ``update_event``; pair with ``unwatch``."""
+        self._watchers[session_id] = self._watchers.get(session_id, 0) + 1
+
+    def unwatch(self, session_id: str) -> None:
+        """
+        Unregister a listener. After the last one leaves, the session's
+        unfired event is dropped, so IDs that never get insights (e.g. a
+        socket for a session that doesn't exist) leave nothing behind.
+        """
+        remaining = self._watchers.pop(session_id, 0) - 1
+        if remaining > 0:
+            self._watchers[session_id] = remaining
+        else:
+            self._update_events.pop(session_id, None)
+
+    def notify(self, session_id: str) -> None:
+        """Wake everyone waiting on the session's insights."""
+        event = self._update_events.pop(session_id, None)
+        if event is not None:
+            event.set()
 
     async def add_segments(
         self, session_id: str, segments: list[TranscriptSegment]
     ) -> int:
         """
-        Add segments to a session (creating it if needed).
+        Add segments to a session (creating it if needed, which may evict
+        the least recently used session).
 
         Returns the number of *new* (non-duplicate) segments added.
         """
-        async with self._lock:
-            if session_id not in self._sessions:
-                self._sessions[session_id] = SessionData(session_id=session_id)
-            return self._sessions[session_id].add_segments(segments)
+        session = self._touch(session_id)
+        if session is None:
+            session = self._sessions[session_id] = SessionData(session_id=session_id)
+            self._recency[session_id] = None
+            while len(self._sessions) > self._max_sessions:
+                self._evict_oldest()
+        async with session._lock:
+            return session.add_segments(segments)
 
     async def get_session(self, session_id: str) -> SessionData | None:
         """Retrieve session data, or None if the session doesn't exist."""
-        async with self._lock:
-            return self._sessions.get(session_id)
+        return self._touch(session_id)
 
-    async def run_analysis(self, session_id: str) -> SessionInsights | None:
+    async def _analyze_full(self, session: SessionData) -> SessionInsights:
         """
-        Run the insight engine on a session's segments and cache the result.
+        Run a full engine pass over a snapshot of the session's segments.
 
-        Import is deferred to avoid circular imports.
+        The session lock is held only to take the snapshot and to store the
+        result, so webhooks keep landing while the engine runs. Callers must
+        hold the session's analysis lock. Import is deferred to avoid
+        circular imports.
         """
         from app.engine.insight_engine import insight_engine
 
-        async with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            result = insight_engine.analyze_segments(
-                segments=session.ordered_segments,
+        session_id = session.session_id
+        async with session._lock:
+            segments = list(session.segments)  # snapshot for the worker thread
+            pending, session._unanalyzed = session._unanalyzed, []
+        try:
+            result = await _run_in_pool(
+                insight_engine.analyze_segments,
+                segments=segments,
                 session_id=session_id,
             )
+        except BaseException:
+            # Requeue so the next run still covers these segments
+            session._unanalyzed[:0] = pending
+            raise
+        async with session._lock:
             session.latest_insights = result
+        self.notify(session_id)
+        return result
+
+    async def run_analysis(self, session_id: str) -> SessionInsights | None:
+        """Run the insight engine on a session's segments and cache the result."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        async with session._analysis_lock:
+            return await self._analyze_full(session)
+
+    async def analyze_incremental(self, session_id: str) -> SessionInsights | None:
+        """
+        Analyze only the segments stored since the last run and merge the
+        new insights into the cached result.
+
+        Falls back to a full analysis when nothing is cached yet, or when
+        the engine uses a sliding window (old insights must drop out).
+        """
+        from app.engine.insight_engine import insight_engine
+
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        async with session._analysis_lock:
+            previous = session.latest_insights
+            if previous is None or insight_engine.window_size != 0:
+                return await self._analyze_full(session)
+
+            async with session._lock:
+                new_segments = session._unanalyzed
+                session._unanalyzed = []
+            if not new_segments:
+                return previous
+            new_segments.sort(key=_by_timestamp)
+            try:
+                result = await _run_in_pool(
+                    insight_engine.analyze_segments,
+                    segments=new_segments,
+                    session_id=session_id,
+                    previous=previous,
+                )
+            except BaseException:
+                session._unanalyzed[:0] = new_segments  # retry on the next run
+                raise
+            async with session._lock:
+                session.latest_insights = result
+            self.notify(session_id)
             return result
 
     async def get_insights(self, session_id: str) -> SessionInsights | None:
         """Return cached insights for a session, or None."""
-        async with self._lock:
-            session = self._sessions.get(session_id)
-            if session is None:
-                return None
-            return session.latest_insights
+        session = self._touch(session_id)
+        if session is None:
+            return None
+        return session.latest_insights
 
     async def list_sessions(self) -> list[str]:
         """Return all active session IDs."""
-        async with self._lock:
-            return list(self._sessions.keys())
+        return list(self._sessions)
 
     async def get_stats(self) -> dict[str, Any]:
         """Return summary statistics across all sessions."""
-        async with self._lock:
-            return {
-                "active_sessions": len(self._sessions),
-                "total_segments": sum(
-                    s.segment_count for s in self._sessions.values()
-                ),
-            }
+        sessions = list(self._sessions.values())
+        return {
+            "active_sessions": len(sessions),
+            "total_segments": sum(s.segment_count for s in sessions),
+        }
 
 
 # ── Module-level singleton ────────────────────────────────────────────
 # Imported by the webhook router and any other module that needs access.
-session_store = SessionStore()
+session_store = SessionStore(max_sessions=get_settings().max_sessions)